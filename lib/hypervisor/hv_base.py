@@ -49,6 +49,7 @@ dict is the same, see the docstring for L{BaseHypervisor.PARAMETERS}.
 import os
 import re
 import logging
+import time
 
 
 from ganeti import constants
@@ -86,17 +87,52 @@ def _IsMultiCpuMaskWellFormed(cpu_mask):
   return True
 
 
+# Only a handful of the ~50 meminfo keys are needed; matching them with
+# a single precompiled regex avoids allocating a line list and the
+# per-line split/strip churn on every GetLinuxNodeInfo call.
+_MEMINFO_RE = re.compile(r"^(MemTotal|MemFree|Buffers|Cached|Active):\s*(\d+)",
+                         re.M)
+
+_PROCESSOR_RE = re.compile(r"^processor\s*:\s*[0-9]+\s*$", re.M)
+
+
+# The number of CPUs is invariant for the lifetime of the node, so the
+# result of parsing the cpuinfo file is cached after the first read
+# (keyed by file name, as callers may pass a non-default file).
+_cpu_total_cache = {}
+
+
+# File existence checks run for every file-typed parameter of every
+# instance, and many instances share the same kernel, initrd or ISO
+# path; caching the verdict for a few seconds collapses those repeated
+# stat calls into one per distinct path.
+_ISFILE_CACHE_TTL = 5
+_isfile_cache = {}
+
+
+def _CachedIsFile(path):
+  """Check whether a path is an existing file, with a short-lived cache.
+
+  """
+  now = time.time()
+  cached = _isfile_cache.get(path)
+  if cached is None or now >= cached[0]:
+    cached = (now + _ISFILE_CACHE_TTL, os.path.isfile(path))
+    _isfile_cache[path] = cached
+  return cached[1]
+
+
 # Read the BaseHypervisor.PARAMETERS docstring for the syntax of the
 # _CHECK values
 
 # must be a file
 _FILE_CHECK = (utils.IsNormAbsPath, "must be an absolute normalized path",
-               os.path.isfile, "not found or not a file")
+               _CachedIsFile, "not found or not a file")
 
 # must be a file or a URL
 _FILE_OR_URL_CHECK = (lambda x: utils.IsNormAbsPath(x) or utils.IsUrl(x),
                       "must be an absolute normalized path or a URL",
-                      lambda x: os.path.isfile(x) or utils.IsUrl(x),
+                      lambda x: _CachedIsFile(x) or utils.IsUrl(x),
                       "not found or not a file or URL")
 
 # must be a directory
@@ -689,40 +725,34 @@ class BaseHypervisor(object):
 
     """
     try:
-      data = utils.ReadFile(meminfo).splitlines()
+      data = utils.ReadFile(meminfo)
     except EnvironmentError as err:
       raise errors.HypervisorError("Failed to list node info: %s" % (err,))
 
     result = {}
     sum_free = 0
-    try:
-      for line in data:
-        splitfields = line.split(":", 1)
-
-        if len(splitfields) > 1:
-          key = splitfields[0].strip()
-          val = splitfields[1].strip()
-          if key == "MemTotal":
-            result["memory_total"] = int(val.split()[0]) // 1024
-          elif key in ("MemFree", "Buffers", "Cached"):
-            sum_free += int(val.split()[0]) // 1024
-          elif key == "Active":
-            result["memory_dom0"] = int(val.split()[0]) // 1024
-    except (ValueError, TypeError) as err:
-      raise errors.HypervisorError("Failed to compute memory usage: %s" %
-                                   (err,))
+    for match in _MEMINFO_RE.finditer(data):
+      key = match.group(1)
+      val = int(match.group(2)) // 1024
+      if key == "MemTotal":
+        result["memory_total"] = val
+      elif key == "Active":
+        result["memory_dom0"] = val
+      else: # MemFree, Buffers, Cached
+        sum_free += val
     result["memory_free"] = sum_free
 
-    cpu_total = 0
-    try:
-      fh = open(cpuinfo)
+    cpu_total = _cpu_total_cache.get(cpuinfo)
+    if cpu_total is None:
       try:
-        cpu_total = len(re.findall(r"(?m)^processor\s*:\s*[0-9]+\s*$",
-                                   fh.read()))
-      finally:
-        fh.close()
-    except EnvironmentError as err:
-      raise errors.HypervisorError("Failed to list node info: %s" % (err,))
+        fh = open(cpuinfo)
+        try:
+          cpu_total = len(_PROCESSOR_RE.findall(fh.read()))
+        finally:
+          fh.close()
+      except EnvironmentError as err:
+        raise errors.HypervisorError("Failed to list node info: %s" % (err,))
+      _cpu_total_cache[cpuinfo] = cpu_total
     result["cpu_total"] = cpu_total
     # We assume that the node OS can access all the CPUs
     result["cpu_dom0"] = cpu_total
@@ -32,6 +32,7 @@
 
 """
 
+import copy
 import errno
 import os
 import os.path
@@ -69,7 +70,7 @@ from ganeti.hypervisor import hv_base
 from ganeti.utils import wrapper as utils_wrapper
 
 from ganeti.hypervisor.hv_kvm.monitor import QmpConnection, QmpMessage, \
-                                             MonitorSocket
+                                             MonitorSocket, HmpConnection
 from ganeti.hypervisor.hv_kvm.netdev import OpenTap
 
 
@@ -460,6 +461,101 @@ def _AnalyzeSerializedRuntime(serialized_runtime):
   return (kvm_cmd, kvm_nics, hvparams, kvm_disks)
 
 
+def _ReadSmallFile(path):
+  """Read a small file with a bare open/read/close sequence.
+
+  Going through L{utils.ReadFile} allocates a full buffered file object
+  per read, which is pure overhead for the few-byte pidfiles and the
+  C{/proc} entries read by the hot list/info paths.
+
+  @type path: string
+  @param path: the file to read
+  @rtype: string or None
+  @return: the decoded file contents, or None if the file could not be
+      read
+
+  """
+  try:
+    fd = os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+  except OSError:
+    return None
+  try:
+    chunks = []
+    while True:
+      chunk = os.read(fd, 4096)
+      if not chunk:
+        break
+      chunks.append(chunk)
+  except OSError:
+    return None
+  finally:
+    os.close(fd)
+  return b"".join(chunks).decode("utf-8", "replace")
+
+
+def _ReadPidFileFast(pidfile):
+  """Read a pid from a file, without buffered file objects.
+
+  Same contract as L{utils.ReadPidFile}, minus the logging on
+  unexpected errors; meant for the hot list/info code paths.
+
+  @type pidfile: string
+  @param pidfile: path to the file containing the pid
+  @rtype: int
+  @return: the process id, or 0 if the file is missing or invalid
+
+  """
+  data = _ReadSmallFile(pidfile)
+  if data is None:
+    return 0
+  try:
+    return int(data)
+  except (TypeError, ValueError):
+    return 0
+
+
+def _BatchReadFiles(paths):
+  """Read a batch of small files with minimal per-file overhead.
+
+  @type paths: iterable of string
+  @param paths: the files to read
+  @rtype: dict
+  @return: a mapping of path to file contents; files which could not be
+      read are left out
+
+  """
+  result = {}
+  for path in paths:
+    content = _ReadSmallFile(path)
+    if content is not None:
+      result[path] = content
+  return result
+
+
+def _CopyKVMRuntime(runtime):
+  """Return an independent copy of a parsed KVM runtime tuple.
+
+  The runtime shape is fixed (see L{_AnalyzeSerializedRuntime}): a flat
+  command line of strings, NIC objects, an hvparams dict of scalar
+  values and (disk, link, uri) entries. Copying the flat parts directly
+  avoids dragging the generic copy.deepcopy machinery over the hundreds
+  of command line strings on every cached load; only the device objects
+  with their nested dicts need a real deep copy.
+
+  @type runtime: tuple
+  @param runtime: (cmd, nics, hvparams, bdevs)
+  @rtype: tuple
+  @return: an independent copy of the runtime
+
+  """
+  kvm_cmd, kvm_nics, hvparams, kvm_disks = runtime
+  return (list(kvm_cmd),
+          [copy.deepcopy(nic) for nic in kvm_nics],
+          dict(hvparams),
+          [(copy.deepcopy(disk), link, uri)
+           for disk, link, uri in kvm_disks])
+
+
 class HeadRequest(urllib.request.Request):
   def get_method(self):
     return "HEAD"
@@ -600,8 +696,21 @@ class KVMHypervisor(hv_base.BaseHypervisor):
   _VIRTIO_NET_PCI = "virtio-net-pci"
   _VIRTIO_BLK_PCI = "virtio-blk-pci"
 
-  _MIGRATION_INFO_MAX_BAD_ANSWERS = 5
-  _MIGRATION_INFO_RETRY_DELAY = 2
+  # Retry delays for unusable 'query-migrate' answers: start quickly, as
+  # transient bad answers usually clear up within a fraction of a
+  # second, and back off towards the old fixed two second delay; with
+  # these settings 11 bad answers add up to ~11s of waiting, roughly
+  # the 5 x 2s budget used before the backoff was introduced
+  _MIGRATION_INFO_MAX_BAD_ANSWERS = 11
+  _MIGRATION_INFO_RETRY_DELAY_MIN = 0.1
+  _MIGRATION_INFO_RETRY_DELAY_MAX = 2
+  _MIGRATION_INFO_RETRY_BACKOFF = 1.5
+
+  # GetNodeInfo is called from polling paths; memory figures change
+  # slowly relative to the caller frequency and the KVM version is
+  # invariant, so results are kept for a short time (per KVM binary).
+  _NODE_INFO_TTL = 1
+  _node_info_cache = {}
 
   _VERSION_RE = re.compile(r"\b(\d+)\.(\d+)(\.(\d+))?\b")
 
@@ -668,13 +777,29 @@ class KVMHypervisor(hv_base.BaseHypervisor):
     _KVMOPT_DEVICELIST: (["-device", "?"], True),
   }
 
+  # Whether the runtime directories have been created by this process;
+  # see __init__
+  _dirs_ensured = False
+
+  # Confirmed process identities, mapping instance name to a
+  # (pid, start time) pair; see _InstanceIdentityConfirmed()
+  _pid_identities = {}
+
   def __init__(self):
     hv_base.BaseHypervisor.__init__(self)
-    # Let's make sure the directories we need exist, even if the RUN_DIR lives
-    # in a tmpfs filesystem or has been otherwise wiped out.
-    dirs = [(dname, constants.RUN_DIRS_MODE) for dname in self._DIRS]
-    utils.EnsureDirs(dirs)
+    # Let's make sure the directories we need exist; RUN_DIR typically
+    # lives in a tmpfs filesystem, so they have to be recreated after a
+    # reboot. Hypervisor objects are constructed on every RPC dispatch,
+    # hence this is done only once per process lifetime; a RUN_DIR wiped
+    # while the node is running is not recovered from.
+    if not KVMHypervisor._dirs_ensured:
+      dirs = [(dname, constants.RUN_DIRS_MODE) for dname in self._DIRS]
+      utils.EnsureDirs(dirs)
+      KVMHypervisor._dirs_ensured = True
     self.qmp = None
+    # Parsed runtime files, mapping instance name to (mtime, runtime
+    # tuple); see _LoadKVMRuntime()
+    self._runtime_cache = {}
 
   @staticmethod
   def VersionsSafeForMigration(src, target):
@@ -700,6 +825,94 @@ class KVMHypervisor(hv_base.BaseHypervisor):
     """
     return utils.PathJoin(cls._UIDS_DIR, instance_name)
 
+  @staticmethod
+  def _PidAliveFast(pid):
+    """Check whether a process exists, using a single syscall.
+
+    Unlike L{utils.IsProcessAlive} this does not go through the retry
+    machinery, which makes it suitable for the hot list/info code paths
+    where a liveness check is done once per instance. The caller is
+    expected to use L{utils.IsProcessAlive} where a definitive answer
+    is needed, e.g. after having killed a process.
+
+    @type pid: string or int
+    @param pid: the process ID to check
+    @rtype: boolean
+    @return: True if the process exists
+
+    """
+    try:
+      pid = int(pid)
+    except (TypeError, ValueError):
+      return False
+    if pid <= 0:
+      return False
+    # Probing with signal 0 hits the process table directly, without
+    # building a /proc path and resolving its inode
+    try:
+      os.kill(pid, 0)
+    except OSError as err:
+      # EPERM means the process exists but belongs to another user
+      return err.errno == errno.EPERM
+    return True
+
+  @staticmethod
+  def _GetProcessStartTime(pid):
+    """Return the kernel start time of a process, or None.
+
+    @type pid: int
+    @param pid: the process ID
+    @rtype: int or None
+    @return: the start time in clock ticks since boot, or None if the
+        process does not exist or its stat file cannot be parsed
+
+    """
+    stat = _ReadSmallFile("/proc/%d/stat" % pid)
+    if stat is None:
+      return None
+    # The command name in the second field may contain spaces, so split
+    # after its closing parenthesis; the start time is field 22, i.e.
+    # the 20th field after the command name
+    try:
+      return int(stat.rsplit(")", 1)[1].split()[19])
+    except (IndexError, ValueError):
+      return None
+
+  @classmethod
+  def _InstanceIdentityConfirmed(cls, instance_name, pid):
+    """Check that a live pid really belongs to the given instance.
+
+    The pidfile and the info sidecar are left behind when QEMU crashes,
+    so the pid read from them may have been recycled by an unrelated
+    process. A (pid, start time) pair, on the other hand, uniquely
+    identifies a process for the node's lifetime; once the identity has
+    been confirmed through the process command line, later calls only
+    have to compare that pair.
+
+    @type instance_name: string
+    @param instance_name: the instance name
+    @type pid: int
+    @param pid: the process ID, already known to be alive
+    @rtype: boolean
+    @return: True if the process runs the given instance
+
+    """
+    starttime = cls._GetProcessStartTime(pid)
+    if (starttime is not None and
+        cls._pid_identities.get(instance_name) == (pid, starttime)):
+      return True
+
+    try:
+      cmd_instance, _, _ = cls._InstancePidInfo(pid)
+    except errors.HypervisorError:
+      return False
+    if cmd_instance != instance_name:
+      return False
+
+    if starttime is not None:
+      cls._pid_identities[instance_name] = (pid, starttime)
+    return True
+
   @classmethod
   def _InstancePidInfo(cls, pid):
     """Check pid file for instance information.
@@ -714,8 +927,7 @@ class KVMHypervisor(hv_base.BaseHypervisor):
     @raise errors.HypervisorError: when an instance cannot be found
 
     """
-    alive = utils.IsProcessAlive(pid)
-    if not alive:
+    if not cls._PidAliveFast(pid):
       raise errors.HypervisorError("Cannot get info for pid %s" % pid)
 
     cmdline_file = utils.PathJoin("/proc", str(pid), "cmdline")
@@ -729,15 +941,21 @@ class KVMHypervisor(hv_base.BaseHypervisor):
     memory = 0
     vcpus = 0
 
-    arg_list = cmdline.split("\x00")
-    while arg_list:
-      arg = arg_list.pop(0)
+    # list.pop(0) is O(n) per call; walk the arguments by index instead
+    # and stop as soon as all three values have been found, which for a
+    # typical kvm command line is well before the device options start
+    args = cmdline.split("\x00")
+    for i, arg in enumerate(args):
       if arg == "-name":
-        instance = arg_list.pop(0).split(",")[0]
+        instance = args[i + 1].split(",")[0]
       elif arg == "-m":
-        memory = int(arg_list.pop(0))
+        memory = int(args[i + 1])
       elif arg == "-smp":
-        vcpus = int(arg_list.pop(0).split(",")[0])
+        vcpus = int(args[i + 1].split(",")[0])
+      else:
+        continue
+      if instance is not None and memory and vcpus:
+        break
 
     if instance is None:
       raise errors.HypervisorError("Pid %s doesn't contain a ganeti kvm"
@@ -756,7 +974,7 @@ class KVMHypervisor(hv_base.BaseHypervisor):
 
     """
     pidfile = cls._InstancePidFile(instance_name)
-    pid = utils.ReadPidFile(pidfile)
+    pid = _ReadPidFileFast(pidfile)
 
     alive = False
     try:
@@ -838,6 +1056,60 @@ class KVMHypervisor(hv_base.BaseHypervisor):
     """
     return utils.PathJoin(cls._CONF_DIR, "%s.runtime" % instance_name)
 
+  @classmethod
+  def _InstanceInfoFile(cls, instance_name):
+    """Returns the instance info sidecar filename
+
+    """
+    return utils.PathJoin(cls._CONF_DIR, "%s.info" % instance_name)
+
+  @classmethod
+  def _SaveInstanceInfo(cls, instance_name, kvm_cmd):
+    """Write the instance info sidecar file.
+
+    Stores the memory and vcpu figures next to the runtime file, so
+    that L{GetInstanceInfo} does not have to recover them from
+    C{/proc/<pid>/cmdline}; the values are taken from the very command
+    line we are about to run.
+
+    @type instance_name: string
+    @param instance_name: instance name
+    @type kvm_cmd: list
+    @param kvm_cmd: runcmd input for kvm
+
+    """
+    try:
+      memory = int(kvm_cmd[kvm_cmd.index("-m") + 1])
+      vcpus = int(str(kvm_cmd[kvm_cmd.index("-smp") + 1]).split(",")[0])
+    except (ValueError, IndexError):
+      return
+    try:
+      utils.WriteFile(cls._InstanceInfoFile(instance_name),
+                      data=serializer.Dump({
+                        "memory": memory,
+                        "vcpus": vcpus,
+                        }))
+    except EnvironmentError:
+      logging.warning("Failed to save info file for instance %s",
+                      instance_name, exc_info=True)
+
+  @classmethod
+  def _TryReadInstanceInfo(cls, instance_name):
+    """Try to read the instance info sidecar file.
+
+    @type instance_name: string
+    @param instance_name: instance name
+    @rtype: tuple or None
+    @return: (memory, vcpus), or None if the file is missing or invalid
+
+    """
+    try:
+      data = serializer.Load(
+        utils.ReadFile(cls._InstanceInfoFile(instance_name)))
+      return (int(data["memory"]), int(data["vcpus"]))
+    except (EnvironmentError, ValueError, KeyError, TypeError):
+      return None
+
   @classmethod
   def _InstanceChrootDir(cls, instance_name):
     """Returns the name of the KVM chroot dir of the instance
@@ -880,12 +1152,14 @@ class KVMHypervisor(hv_base.BaseHypervisor):
     """Removes an instance's rutime sockets/files/dirs.
 
     """
-    utils.RemoveFile(pidfile)
-    utils.RemoveFile(cls._InstanceMonitor(instance_name))
-    utils.RemoveFile(cls._InstanceSerial(instance_name))
-    utils.RemoveFile(cls._InstanceQmpMonitor(instance_name))
-    utils.RemoveFile(cls._InstanceQemuGuestAgentMonitor(instance_name))
-    utils.RemoveFile(cls._InstanceKVMRuntime(instance_name))
+    for path in (pidfile,
+                 cls._InstanceMonitor(instance_name),
+                 cls._InstanceSerial(instance_name),
+                 cls._InstanceQmpMonitor(instance_name),
+                 cls._InstanceQemuGuestAgentMonitor(instance_name),
+                 cls._InstanceKVMRuntime(instance_name),
+                 cls._InstanceInfoFile(instance_name)):
+      utils.RemoveFile(path)
     uid_file = cls._InstanceUidFile(instance_name)
     uid = cls._TryReadUidFile(uid_file)
     utils.RemoveFile(uid_file)
@@ -1055,9 +1329,37 @@ class KVMHypervisor(hv_base.BaseHypervisor):
     checking whether the associated kvm process is still alive.
 
     """
+    # Read all pidfiles and all /proc/<pid>/cmdline entries in two
+    # batches instead of paying the full _InstancePidAlive() sequence of
+    # syscalls for every single instance.
+    # os.scandir gives us the directory entries without materializing a
+    # full name list first, and entry.path saves a string join per
+    # pidfile.
+    pidfiles = dict((entry.path, entry.name)
+                    for entry in os.scandir(self._PIDS_DIR))
+    pids = {}
+    for path, content in _BatchReadFiles(pidfiles).items():
+      try:
+        pid = int(content)
+      except (TypeError, ValueError):
+        continue
+      if pid > 0:
+        pids[pidfiles[path]] = pid
+
+    cmdlines = _BatchReadFiles(set("/proc/%d/cmdline" % pid
+                                   for pid in pids.values()))
+
     result = []
-    for name in os.listdir(self._PIDS_DIR):
-      if self._InstancePidAlive(name)[2]:
+    for name, pid in pids.items():
+      cmdline = cmdlines.get("/proc/%d/cmdline" % pid)
+      if cmdline is None:
+        continue
+      args = cmdline.split("\x00")
+      try:
+        cmd_instance = args[args.index("-name") + 1].split(",")[0]
+      except (ValueError, IndexError):
+        continue
+      if cmd_instance == name:
         result.append(name)
     return result
 
@@ -1080,14 +1382,37 @@ class KVMHypervisor(hv_base.BaseHypervisor):
     @return: (name, id, memory, vcpus, stat, times)
 
     """
-    _, pid, alive = self._InstancePidAlive(instance_name)
+    # Read the pidfile and /proc/<pid>/cmdline only once; going through
+    # _InstancePidAlive() followed by _InstancePidInfo() would parse the
+    # same cmdline twice.
+    pid = _ReadPidFileFast(self._InstancePidFile(instance_name))
+    info = self._TryReadInstanceInfo(instance_name)
+    if info is not None:
+      # The sidecar spares the cmdline parse for memory/vcpus, but a
+      # live pid must still be confirmed to belong to this instance:
+      # after a QEMU crash the pidfile and the sidecar are exactly the
+      # files that were not cleaned up, and the pid may have been
+      # recycled by an unrelated process.
+      memory, vcpus = info
+      alive = (self._PidAliveFast(pid)
+               and self._InstanceIdentityConfirmed(instance_name, pid))
+    else:
+      # Fallback for instances started before the info sidecar was
+      # introduced, or whose runtime was written directly by a
+      # migration.
+      memory = vcpus = 0
+      try:
+        cmd_instance, memory, vcpus = self._InstancePidInfo(pid)
+        alive = (cmd_instance == instance_name)
+      except errors.HypervisorError:
+        alive = False
+
     if not alive:
       if self._IsUserShutdown(instance_name):
         return (instance_name, -1, 0, 0, hv_base.HvInstanceState.SHUTDOWN, 0)
       else:
         return None
 
-    _, memory, vcpus = self._InstancePidInfo(pid)
     istat = hv_base.HvInstanceState.RUNNING
     times = 0
 
@@ -1113,8 +1438,13 @@ class KVMHypervisor(hv_base.BaseHypervisor):
 
     """
     data = []
-    for entry in os.listdir(self._CONF_DIR):
-      name, _ = os.path.splitext(entry)
+    for entry in os.scandir(self._CONF_DIR):
+      # The conf dir holds a "<name>.runtime" and possibly a
+      # "<name>.info" file per instance; enumerate the instances through
+      # the runtime files only.
+      if not entry.name.endswith(".runtime"):
+        continue
+      name = entry.name[:-len(".runtime")]
       try:
         info = self.GetInstanceInfo(name)
       except errors.HypervisorError:
@@ -1320,8 +1650,8 @@ class KVMHypervisor(hv_base.BaseHypervisor):
       name_parameter = "%s,debug-threads=on" % (instance.name)
     else:
       name_parameter = "%s,debug-threads=off" % (instance.name)
-    kvm_cmd.extend(["-name", name_parameter])
-    kvm_cmd.extend(["-m", instance.beparams[constants.BE_MAXMEM]])
+    kvm_cmd.extend(["-name", name_parameter,
+                    "-m", instance.beparams[constants.BE_MAXMEM]])
 
     smp_list = ["%s" % instance.beparams[constants.BE_VCPUS]]
     if hvp[constants.HV_CPU_CORES]:
@@ -1331,9 +1661,8 @@ class KVMHypervisor(hv_base.BaseHypervisor):
     if hvp[constants.HV_CPU_SOCKETS]:
       smp_list.append("sockets=%s" % hvp[constants.HV_CPU_SOCKETS])
 
-    kvm_cmd.extend(["-smp", ",".join(smp_list)])
-
-    kvm_cmd.extend(["-pidfile", pidfile])
+    kvm_cmd.extend(["-smp", ",".join(smp_list),
+                    "-pidfile", pidfile])
 
     bus_slots = self._GetBusSlots(hvp)
 
@@ -1351,12 +1680,12 @@ class KVMHypervisor(hv_base.BaseHypervisor):
         "%s,id=scsi" % hvp[constants.HV_KVM_SCSI_CONTROLLER_TYPE]
         ])
 
-    kvm_cmd.extend(["-device", "virtio-balloon"])
-    kvm_cmd.extend(["-daemonize"])
     # logfile for qemu
     qemu_logfile = utils.PathJoin(pathutils.LOG_KVM_DIR,
                                   "%s.log" % instance.name)
-    kvm_cmd.extend(["-D", qemu_logfile])
+    kvm_cmd.extend(["-device", "virtio-balloon",
+                    "-daemonize",
+                    "-D", qemu_logfile])
     if not instance.hvparams[constants.HV_ACPI]:
       kvm_cmd.extend(["-no-acpi"])
     if instance.hvparams[constants.HV_REBOOT_BEHAVIOR] == \
@@ -1602,12 +1931,12 @@ class KVMHypervisor(hv_base.BaseHypervisor):
       else:
         # Enable the spice agent communication channel between the host and the
         # agent.
-        kvm_cmd.extend(["-device", "virtio-serial-pci,id=spice"])
         kvm_cmd.extend([
+          "-device", "virtio-serial-pci,id=spice",
           "-device",
           "virtserialport,chardev=spicechannel0,name=com.redhat.spice.0",
+          "-chardev", "spicevmc,id=spicechannel0,name=vdagent",
           ])
-        kvm_cmd.extend(["-chardev", "spicevmc,id=spicechannel0,name=vdagent"])
 
       logging.info("KVM: SPICE will listen on port %s", instance.network_port)
       kvm_cmd.extend(["-spice", spice_arg])
@@ -1686,6 +2015,7 @@ class KVMHypervisor(hv_base.BaseHypervisor):
     """Write an instance's KVM runtime
 
     """
+    self._runtime_cache.pop(instance_name, None)
     try:
       utils.WriteFile(self._InstanceKVMRuntime(instance_name),
                       data=data)
@@ -1715,15 +2045,46 @@ class KVMHypervisor(hv_base.BaseHypervisor):
                                       serialized_disks))
 
     self._WriteKVMRuntime(instance.name, serialized_form)
+    self._SaveInstanceInfo(instance.name, kvm_cmd)
+
+    # Prime the runtime cache (write-through): loads following a save,
+    # as done by the reboot and hotplug paths, then never re-parse the
+    # file we just wrote.
+    try:
+      mtime = os.stat(self._InstanceKVMRuntime(instance.name)).st_mtime_ns
+    except OSError:
+      pass
+    else:
+      self._runtime_cache[instance.name] = (mtime,
+                                            _CopyKVMRuntime(kvm_runtime))
 
   def _LoadKVMRuntime(self, instance, serialized_runtime=None):
     """Load an instance's KVM runtime
 
+    Parsed runtimes are kept in an in-process cache keyed by the
+    runtime file's mtime, as the parse (JSON load plus rebuilding the
+    NIC and disk objects) is pure CPU and invariant unless the file
+    changed. Cache hits return a deep copy, since callers freely modify
+    the runtime tuple before saving it back.
+
     """
-    if not serialized_runtime:
-      serialized_runtime = self._ReadKVMRuntime(instance.name)
+    if serialized_runtime:
+      return _AnalyzeSerializedRuntime(serialized_runtime)
 
-    return _AnalyzeSerializedRuntime(serialized_runtime)
+    try:
+      mtime = os.stat(self._InstanceKVMRuntime(instance.name)).st_mtime_ns
+    except OSError:
+      mtime = None
+
+    if mtime is not None:
+      cached = self._runtime_cache.get(instance.name)
+      if cached is not None and cached[0] == mtime:
+        return _CopyKVMRuntime(cached[1])
+
+    runtime = _AnalyzeSerializedRuntime(self._ReadKVMRuntime(instance.name))
+    if mtime is not None:
+      self._runtime_cache[instance.name] = (mtime, _CopyKVMRuntime(runtime))
+    return runtime
 
   def _RunKVMCmd(self, name, kvm_cmd, tap_fds=None):
     """Run the KVM cmd and check for errors
@@ -2086,32 +2447,17 @@ class KVMHypervisor(hv_base.BaseHypervisor):
     """Invoke a command on the instance monitor.
 
     """
-    if timeout is not None:
-      timeout_cmd = "timeout %s" % (timeout, )
-    else:
-      timeout_cmd = ""
-
     # TODO: Replace monitor calls with QMP once KVM >= 0.14 is the minimum
-    # version. The monitor protocol is designed for human consumption, whereas
-    # QMP is made for programmatic usage. In the worst case QMP can also
-    # execute monitor commands. As it is, all calls to socat take at least
-    # 500ms and likely more: socat can't detect the end of the reply and waits
-    # for 500ms of no data received before exiting (500 ms is the default for
-    # the "-t" parameter).
-    socat = ("echo %s | %s %s STDIO UNIX-CONNECT:%s" %
-             (utils.ShellQuote(command),
-              timeout_cmd,
-              constants.SOCAT_PATH,
-              utils.ShellQuote(cls._InstanceMonitor(instance_name))))
-    result = utils.RunCmd(socat)
-    if result.failed:
-      msg = ("Failed to send command '%s' to instance '%s', reason '%s',"
-             " output: %s" %
-             (command, instance_name, result.fail_reason, result.output))
+    # version. The monitor protocol is designed for human consumption,
+    # whereas QMP is made for programmatic usage.
+    mon = HmpConnection(cls._InstanceMonitor(instance_name))
+    try:
+      return mon.Execute(command, timeout=timeout)
+    except errors.HypervisorError as err:
+      msg = ("Failed to send command '%s' to instance '%s': %s" %
+             (command, instance_name, err))
       raise errors.HypervisorError(msg)
 
-    return result
-
   @_with_qmp
   def VerifyHotplugSupport(self, instance, action, dev_type):
     """Verifies that hotplug is supported.
@@ -2321,7 +2667,7 @@ class KVMHypervisor(hv_base.BaseHypervisor):
     if dev_type == constants.HOTPLUG_TARGET_DISK:
       self.qmp.HotDelDisk(kvm_devid)
       # drive_del is not implemented yet in qmp
-      command = "drive_del %s\n" % kvm_devid
+      command = "drive_del %s" % kvm_devid
       self._CallMonitorCommand(instance.name, command)
     elif dev_type == constants.HOTPLUG_TARGET_NIC:
       self.qmp.HotDelNic(kvm_devid)
@@ -2416,6 +2762,10 @@ class KVMHypervisor(hv_base.BaseHypervisor):
   def _StopInstance(cls, instance, force=False, name=None, timeout=None):
     """Stop an instance.
 
+    @rtype: boolean
+    @return: True if the instance is known to be down, False if a
+        clean shutdown was only requested and is still in progress
+
     """
     assert(timeout is None or force is not None)
 
@@ -2426,20 +2776,27 @@ class KVMHypervisor(hv_base.BaseHypervisor):
       acpi = instance.hvparams[constants.HV_ACPI]
     else:
       acpi = False
+    dead = True
     _, pid, alive = cls._InstancePidAlive(name)
     if pid > 0 and alive:
       if force or not acpi:
-        utils.KillProcess(pid)
+        dead = utils.KillProcess(pid)
       else:
+        # ACPI shutdown is asynchronous; the instance is still up for now
         cls._CallMonitorCommand(name, "system_powerdown", timeout)
+        dead = False
     cls._ClearUserShutdown(instance.name)
+    return dead
 
   def StopInstance(self, instance, force=False, retry=False, name=None,
                    timeout=None):
     """Stop an instance.
 
+    @rtype: boolean
+    @return: True if the instance is known to be down
+
     """
-    self._StopInstance(instance, force, name=name, timeout=timeout)
+    return self._StopInstance(instance, force, name=name, timeout=timeout)
 
   def CleanupInstance(self, instance_name):
     """Cleanup after a stopped instance
@@ -2618,6 +2975,7 @@ class KVMHypervisor(hv_base.BaseHypervisor):
 
     """
 
+    delay = self._MIGRATION_INFO_RETRY_DELAY_MIN
     for _ in range(self._MIGRATION_INFO_MAX_BAD_ANSWERS):
       query_migrate = self.qmp.GetMigrationStatus()
 
@@ -2657,7 +3015,9 @@ class KVMHypervisor(hv_base.BaseHypervisor):
         logging.warning("KVM: unknown 'query-migrate' result: %s",
                         query_migrate)
 
-      time.sleep(self._MIGRATION_INFO_RETRY_DELAY)
+      time.sleep(delay)
+      delay = min(delay * self._MIGRATION_INFO_RETRY_BACKOFF,
+                  self._MIGRATION_INFO_RETRY_DELAY_MAX)
 
     return objects.MigrationStatus(status=constants.HV_MIGRATION_FAILED)
 
@@ -2684,12 +3044,18 @@ class KVMHypervisor(hv_base.BaseHypervisor):
                         revision)
 
     """
-    result = self.GetLinuxNodeInfo()
     kvmpath = constants.KVM_PATH
     if hvparams is not None:
       kvmpath = hvparams.get(constants.HV_KVM_PATH, constants.KVM_PATH)
+
+    cached = self._node_info_cache.get(kvmpath)
+    if cached is not None and time.time() - cached[0] < self._NODE_INFO_TTL:
+      return dict(cached[1])
+
+    result = self.GetLinuxNodeInfo()
     _, v_major, v_min, v_rev = self._GetKVMVersion(kvmpath)
     result[constants.HV_NODEINFO_KEY_VERSION] = (v_major, v_min, v_rev)
+    self._node_info_cache[kvmpath] = (time.time(), dict(result))
     return result
 
   @classmethod
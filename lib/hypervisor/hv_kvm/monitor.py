@@ -233,6 +233,78 @@ def _ensure_connection(fn):
   return wrapper
 
 
+class HmpConnection(MonitorSocket):
+  """Connection to the QEMU human monitor (HMP).
+
+  The human monitor is line based: after connecting it sends a greeting
+  followed by a prompt, and every command is answered with its output
+  followed by the next prompt. Talking to it directly saves the
+  fork/exec of a shell and socat per command, which used to dominate
+  the cost of monitor calls.
+
+  """
+  _PROMPT = b"(qemu) "
+
+  def _connect(self):
+    """Connects to the monitor and consumes the greeting.
+
+    The monitor starts the conversation with a version banner followed
+    by the first prompt; both have to be drained before commands can be
+    sent.
+
+    """
+    super(HmpConnection, self)._connect()
+    try:
+      self._ReadUpToPrompt()
+    except socket.timeout as err:
+      raise errors.HypervisorError("Timeout while waiting for the HMP"
+                                   " greeting: %s" % err)
+    except socket.error as err:
+      raise errors.HypervisorError("Failure while waiting for the HMP"
+                                   " greeting: %s" % err)
+
+  def _ReadUpToPrompt(self):
+    """Read from the socket until a monitor prompt is received.
+
+    @rtype: bytes
+    @return: the data received before the prompt
+
+    """
+    buf = b""
+    while not buf.endswith(self._PROMPT):
+      data = self.sock.recv(4096)
+      if not data:
+        raise errors.HypervisorError("Connection closed by the HMP monitor")
+      buf += data
+    return buf[:-len(self._PROMPT)]
+
+  @_ensure_connection
+  def Execute(self, command, timeout=None):
+    """Execute a single HMP command and return its output.
+
+    @type command: string
+    @param command: the command to execute
+    @type timeout: int or None
+    @param timeout: per-command socket timeout overriding the default
+    @rtype: string
+    @return: the command output, including the echoed command
+    @raise errors.HypervisorError: when there are communication errors
+
+    """
+    if timeout is not None:
+      self.sock.settimeout(timeout)
+    try:
+      self.sock.sendall(command.encode("utf-8") + b"\n")
+      output = self._ReadUpToPrompt()
+    except socket.timeout as err:
+      raise errors.HypervisorError("Timeout while talking to the HMP"
+                                   " monitor: %s" % err)
+    except socket.error as err:
+      raise errors.HypervisorError("Failure while talking to the HMP"
+                                   " monitor: %s" % err)
+    return output.decode("utf-8", "replace")
+
+
 class QmpConnection(MonitorSocket):
   """Connection to the QEMU Monitor using the QEMU Monitor Protocol (QMP).
 
@@ -982,6 +982,9 @@ def KillProcess(pid, signal_=signal.SIGTERM, timeout=30,
   @param waitpid: If true, we should waitpid on this process after
       sending signals, since it's our own child and otherwise it
       would remain as zombie
+  @rtype: boolean
+  @return: True if the process is known to be gone, False if it was
+      still alive at the last check (or no check was requested)
 
   """
   def _helper(pid, signal_, wait):
@@ -997,12 +1000,12 @@ def KillProcess(pid, signal_=signal.SIGTERM, timeout=30,
     raise errors.ProgrammerError("Invalid pid given '%s'" % pid)
 
   if not IsProcessAlive(pid):
-    return
+    return True
 
   _helper(pid, signal_, waitpid)
 
   if timeout <= 0:
-    return
+    return False
 
   def _CheckProcess():
     if not IsProcessAlive(pid):
@@ -1021,12 +1024,16 @@ def KillProcess(pid, signal_=signal.SIGTERM, timeout=30,
   try:
     # Wait up to $timeout seconds
     utils_retry.Retry(_CheckProcess, (0.01, 1.5, 0.1), timeout)
+    return True
   except utils_retry.RetryTimeout:
     pass
 
   if IsProcessAlive(pid):
     # Kill process if it's still alive
     _helper(pid, signal.SIGKILL, waitpid)
+    return not IsProcessAlive(pid)
+
+  return True
 
 
 def RunInSeparateProcess(fn, *args):
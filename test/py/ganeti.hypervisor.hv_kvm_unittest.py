@@ -257,6 +257,106 @@ class TestQmp(testutils.GanetiTestCase):
       qmp_stub.shutdown()
 
 
+class HmpStub(threading.Thread):
+  """Stub for an HMP endpoint for a KVM instance
+
+  """
+  _GREETING = b"QEMU 2.8.1 monitor - type 'help' for more information\r\n"
+  _PROMPT = hv_kvm.HmpConnection._PROMPT
+
+  def __init__(self, socket_filename, server_responses):
+    """Creates an HMP stub
+
+    @type socket_filename: string
+    @param socket_filename: filename of the UNIX socket that will be created
+                            this class and used for the communication
+    @type server_responses: list
+    @param server_responses: list of responses that the server sends in
+                             response to whatever it receives
+    """
+    threading.Thread.__init__(self)
+    self.socket_filename = socket_filename
+    self.script = server_responses[:]
+    self.received = []
+
+    self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    self.socket.bind(self.socket_filename)
+    self.socket.listen(1)
+
+  def run(self):
+    conn, _ = self.socket.accept()
+
+    # The monitor starts the conversation with a banner and a prompt
+    conn.send(self._GREETING + self._PROMPT)
+
+    while self.script:
+      msg = conn.recv(4096)
+      if not msg:
+        break
+      self.received.append(msg)
+
+      response = self.script.pop(0)
+      if isinstance(response, str):
+        conn.send(response.encode("utf-8") + self._PROMPT)
+      elif isinstance(response, list):
+        # Output arriving in multiple send() calls, with the prompt last
+        for chunk in response:
+          conn.send(chunk.encode("utf-8"))
+        conn.send(self._PROMPT)
+      else:
+        raise errors.ProgrammerError("Unknown response type for %s" % response)
+
+    conn.close()
+
+  def shutdown(self):
+    self.socket.close()
+
+
+class TestHmp(testutils.GanetiTestCase):
+  COMMANDS = [
+    "info status",
+    "drive_del drive0",
+    ]
+
+  SERVER_RESPONSES = [
+    # Whole answer in one send()
+    "info status\r\nVM status: running\r\n",
+
+    # Answer split over multiple send() calls
+    ["drive_del drive0\r\nDevice 'drive0'", " not found\r\n"],
+    ]
+
+  EXPECTED_RESPONSES = [
+    "info status\r\nVM status: running\r\n",
+    "drive_del drive0\r\nDevice 'drive0' not found\r\n",
+    ]
+
+  def testHmp(self):
+    # Set up the stub
+    socket_file = tempfile.NamedTemporaryFile()
+    os.remove(socket_file.name)
+    hmp_stub = HmpStub(socket_file.name, self.SERVER_RESPONSES)
+    hmp_stub.start()
+
+    # Set up the HMP connection
+    hmp_connection = hv_kvm.HmpConnection(socket_file.name)
+
+    try:
+      hmp_connection.connect()
+
+      for command, expected_response in zip(self.COMMANDS,
+                                            self.EXPECTED_RESPONSES):
+        self.assertEqual(hmp_connection.Execute(command), expected_response)
+
+      # Commands must arrive newline-terminated, one line each
+      self.assertEqual(hmp_stub.received,
+                       [(command + "\n").encode("utf-8")
+                        for command in self.COMMANDS])
+    finally:
+      hmp_stub.shutdown()
+      hmp_connection.close()
+
+
 class TestConsole(unittest.TestCase):
   def MakeConsole(self, instance, node, group, hvparams):
     cons = hv_kvm.KVMHypervisor.GetInstanceConsole(instance, node, group,
@@ -576,6 +676,10 @@ class TestKvmRuntime(testutils.GanetiTestCase):
     super(TestKvmRuntime, self).setUp()
     kvm_class = 'ganeti.hypervisor.hv_kvm.KVMHypervisor'
     self.MockOut('qmp', mock.patch('ganeti.hypervisor.hv_kvm.QmpConnection'))
+    # Directories are only created once per process; reset the flag so
+    # tests see the EnsureDirs call regardless of what ran before
+    self.MockOut(mock.patch.object(hv_kvm.KVMHypervisor, '_dirs_ensured',
+                                   False))
     self.MockOut('run_cmd', mock.patch('ganeti.utils.RunCmd'))
     self.MockOut('ensure_dirs', mock.patch('ganeti.utils.EnsureDirs'))
     self.MockOut('write_file', mock.patch('ganeti.utils.WriteFile'))
@@ -708,6 +708,52 @@ class TestStartDaemon(testutils.GanetiTestCase):
       os.close(fd)
 
 
+class TestKillProcess(unittest.TestCase):
+  """Testing case for KillProcess"""
+
+  def testAlreadyDead(self):
+    pid = os.fork()
+    if pid == 0:
+      os._exit(0)
+    elif pid < 0:
+      raise SystemError("can't fork")
+    os.waitpid(pid, 0)
+    self.assertTrue(utils.KillProcess(pid))
+
+  def testKilledWithinTimeout(self):
+    pid = os.fork()
+    if pid == 0:
+      time.sleep(60)
+      os._exit(0)
+    elif pid < 0:
+      raise SystemError("can't fork")
+    self.assertTrue(utils.KillProcess(pid, timeout=10.0, waitpid=True))
+    self.assertFalse(utils.IsProcessAlive(pid))
+
+  def testNoTimeoutReturnsFalse(self):
+    # Make sure the child has its SIGTERM handler installed before the
+    # parent starts sending signals
+    (read_fd, write_fd) = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+      signal.signal(signal.SIGTERM, signal.SIG_IGN)
+      os.write(write_fd, b"x")
+      time.sleep(60)
+      os._exit(0)
+    elif pid < 0:
+      raise SystemError("can't fork")
+    os.close(write_fd)
+    self.assertEqual(os.read(read_fd, 1), b"x")
+    os.close(read_fd)
+    try:
+      # With timeout <= 0 no liveness check is made, so the process
+      # cannot be reported as gone
+      self.assertFalse(utils.KillProcess(pid, timeout=0))
+      self.assertTrue(utils.IsProcessAlive(pid))
+    finally:
+      utils.KillProcess(pid, signal_=signal.SIGKILL, timeout=5.0, waitpid=True)
+
+
 class RunInSeparateProcess(unittest.TestCase):
   def test(self):
     for exp in [True, False]: